@@ -9,10 +9,47 @@
 """
 
 import typing as T
+import atexit
+import functools
 
 from .mysql_engine import create_engine
+from .ssh_tunnel import is_tunnel_alive
 from .ssh_tunnel import test_ssh_tunnel as _test_ssh_tunnel
 
+if T.TYPE_CHECKING:  # pragma: no cover
+    import sqlalchemy as sa
+
+
+@functools.lru_cache(maxsize=8)
+def _get_engine(
+    db_port: int,
+    db_username: str,
+    db_password: str,
+    db_name: str,
+    timeout: int,
+) -> "sa.engine.Engine":
+    """
+    Create (or reuse) a mysql engine for the given connection parameters.
+
+    创建 (或复用) 一个 mysql engine. Engine 对象的创建涉及 driver 导入, dialect 初始化
+    和连接池的构建, 开销不小. 由于 Engine 本身是可以复用的, 我们用 lru_cache 按照连接参数
+    缓存它, 这样反复调用 :func:`test_ssh_tunnel` 时不会重复构建.
+
+    由于 engine 的生命周期跨越多次 tunnel 的重建, 池子里的连接随时可能已经失效, 所以
+    打开 ``pool_pre_ping`` 让失效连接被透明地换掉. 每个 engine 在进程退出时会被 dispose.
+    """
+    engine = create_engine(
+        host="127.0.0.1",
+        port=db_port,
+        username=db_username,
+        password=db_password,
+        db_name=db_name,
+        connect_args={"connect_timeout": timeout},
+        pool_pre_ping=True,
+    )
+    atexit.register(engine.dispose)
+    return engine
+
 
 def test_ssh_tunnel(
     db_port: int,
@@ -42,13 +79,19 @@ def test_ssh_tunnel(
 
     :return: 如果 SSH Tunnel 正常工作, 返回 True, 否则返回 False.
     """
-    engine = create_engine(
-        host="127.0.0.1",
-        port=db_port,
-        username=db_username,
-        password=db_password,
+    # cheap TCP probe first: if nothing listens on the forwarded port,
+    # fail fast without building an engine and doing the DB handshake
+    if is_tunnel_alive(db_port, timeout=timeout) is False:
+        if verbose:
+            print_func(f"Nothing is listening on 127.0.0.1:{db_port}.")
+        return False
+
+    engine = _get_engine(
+        db_port=db_port,
+        db_username=db_username,
+        db_password=db_password,
         db_name=db_name,
-        connect_args={"connect_timeout": timeout},
+        timeout=timeout,
     )
     return _test_ssh_tunnel(
         engine=engine,
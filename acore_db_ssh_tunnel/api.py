@@ -2,8 +2,14 @@
 
 from . import ssh_tunnel as ssh_tunnel_lib
 from .ssh_tunnel import create_ssh_tunnel
+from .ssh_tunnel import create_ssh_tunnels
 from .ssh_tunnel import list_ssh_tunnel_pid
 from .ssh_tunnel import list_ssh_tunnel
+from .ssh_tunnel import is_tunnel_alive
 from .acore_ssh_tunnel import test_ssh_tunnel
 from .ssh_tunnel import kill_ssh_tunnel
+from .ssh_tunnel import kill_ssh_tunnels
+from .ssh_tunnel import close_ssh_master
+from .paramiko_tunnel import ParamikoSshTunnel
+from .paramiko_tunnel import create_ssh_tunnel_paramiko
 from .mysql_engine import create_engine
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+In-process SSH Tunnel backend based on `paramiko <https://www.paramiko.org/>`_.
+
+[CN]
+
+用 paramiko 在 Python 进程内建立 SSH Tunnel. 和 :mod:`.ssh_tunnel` 中 fork openssh
+子进程的做法不同, 本实现把 SSH 连接保留在当前进程中, 有以下好处:
+
+- 不需要 fork / exec 任何子进程.
+- 同一个 SSH 连接可以复用给多个 tunnel.
+- 关闭 tunnel 时直接调用 :meth:`ParamikoSshTunnel.close` 即可, 无需扫描进程列表.
+
+paramiko 是可选依赖, 使用本模块前请先 ``pip install paramiko``.
+"""
+
+import typing as T
+import socket
+import threading
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import paramiko
+
+
+def _pump(src, dst):
+    """
+    Copy bytes from ``src`` to ``dst`` until EOF, then close both ends.
+    Works for both socket -> channel and channel -> socket directions.
+    """
+    try:
+        while True:
+            data = src.recv(16384)
+            if not data:
+                break
+            dst.sendall(data)
+    except OSError:
+        pass
+    finally:
+        for end in (src, dst):
+            try:
+                end.close()
+            except OSError:
+                pass
+
+
+class ParamikoSshTunnel:
+    """
+    Handle of an in-process SSH Tunnel.
+
+    一个进程内 SSH Tunnel 的句柄. 它在 ``127.0.0.1:db_port`` 上监听, 把每个进来的
+    连接通过 SSH 连接转发到数据库. 用完后调用 :meth:`close` 关闭.
+
+    不要直接构造这个类, 请使用 :func:`create_ssh_tunnel_paramiko`.
+    """
+
+    def __init__(
+        self,
+        client: "paramiko.SSHClient",
+        listener: socket.socket,
+        db_host: str,
+        db_port: int,
+    ):
+        self.client = client
+        self.db_host = db_host
+        self.db_port = db_port
+        self._listener = listener
+        self._closed = False
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        transport = self.client.get_transport()
+        while not self._closed:
+            try:
+                sock, peer = self._listener.accept()
+            except OSError:
+                # the listener was closed by close()
+                break
+            try:
+                channel = transport.open_channel(
+                    "direct-tcpip",
+                    (self.db_host, self.db_port),
+                    peer,
+                )
+            except Exception:
+                sock.close()
+                continue
+            threading.Thread(target=_pump, args=(sock, channel), daemon=True).start()
+            threading.Thread(target=_pump, args=(channel, sock), daemon=True).start()
+
+    def close(self):
+        """
+        Tear down the tunnel and the underlying SSH connection.
+
+        关闭 tunnel 和底层的 SSH 连接.
+        """
+        self._closed = True
+        try:
+            self._listener.close()
+        except OSError:
+            pass
+        self.client.close()
+
+    def __enter__(self) -> "ParamikoSshTunnel":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def create_ssh_tunnel_paramiko(
+    path_pem_file,
+    db_host: str,
+    db_port: int,
+    jump_host_username: str,
+    jump_host_public_ip: str,
+    verbose: bool = True,
+    print_func: T.Callable = print,
+    timeout: float = 10.0,
+) -> ParamikoSshTunnel:
+    """
+    Create an in-process SSH Tunnel with paramiko.
+
+    用 paramiko 创建一个进程内的 SSH Tunnel. 参数和 :func:`~.ssh_tunnel.create_ssh_tunnel`
+    一致, 但返回一个 :class:`ParamikoSshTunnel` 句柄, 关闭 tunnel 时调用它的
+    :meth:`~ParamikoSshTunnel.close` 方法即可, 不需要 :func:`~.ssh_tunnel.kill_ssh_tunnel`.
+
+    :param path_pem_file: AWS SSH pem 秘钥的路径.
+    :param db_host: 数据库的 endpoint, 在此情况下一般是私网的 IP. 如果是 AWS RDS, 则是 RDS 的 endpoint.
+    :param db_port: 数据库的端口. 在本项目中数据库是 MySQL, 所以端口通常是 3306.
+    :param jump_host_username: 跳板机的操作系统用户名, 用与创建 SSH 连接.
+    :param jump_host_public_ip: 跳板机的公网 IP 地址.
+    :param verbose: 是否打印详细信息.
+    :param print_func: 打印函数. 默认是 print, 你可以用自定义的 logger 来替换它.
+    :param timeout: SSH 连接的超时秒数.
+
+    :return: :class:`ParamikoSshTunnel` 句柄.
+    """
+    try:
+        import paramiko
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "the in-process tunnel backend requires the optional dependency "
+            "'paramiko', run 'pip install paramiko' first."
+        )
+
+    # claim the local port first: if it is already taken (most likely an
+    # existing tunnel), fail fast without authenticating to the jump host
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        listener.bind(("127.0.0.1", db_port))
+        listener.listen(8)
+    except OSError:
+        listener.close()
+        raise
+
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    try:
+        client.connect(
+            hostname=jump_host_public_ip,
+            username=jump_host_username,
+            key_filename=str(path_pem_file),
+            timeout=timeout,
+        )
+    except Exception:
+        listener.close()
+        client.close()
+        raise
+
+    if verbose:
+        print_func(
+            f"Forward 127.0.0.1:{db_port} to {db_host}:{db_port} "
+            f"via {jump_host_username}@{jump_host_public_ip} (in-process)."
+        )
+    return ParamikoSshTunnel(
+        client=client,
+        listener=listener,
+        db_host=db_host,
+        db_port=db_port,
+    )
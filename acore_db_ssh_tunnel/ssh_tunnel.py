@@ -24,12 +24,107 @@ Reference:
     本模块不考虑用一个 pem 秘钥开启多个 SSH Tunnel 连接到不同跳板机的情况. 我们假设同一时间
     一个秘钥只能创建一个 SSH Tunnel.
 """
+import os
 import sys
+import time
+import signal
+import select
+import socket
+import hashlib
+import functools
 import typing as T
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-import sqlalchemy as sa
+if T.TYPE_CHECKING:  # pragma: no cover
+    import sqlalchemy as sa
+
+
+def _get_control_path(path_pem_file) -> str:
+    """
+    Locate the SSH control socket for a given pem file.
+
+    根据 pem 文件路径计算 SSH control socket 的路径. 我们用 pem 路径的哈希作为文件名,
+    这样同一个 pem 秘钥创建的多个 tunnel 可以复用同一个 master 连接.
+
+    :param path_pem_file: AWS SSH pem 秘钥的路径.
+
+    :return: ``~/.ssh/`` 下的 control socket 路径.
+    """
+    digest = hashlib.blake2s(str(path_pem_file).encode("utf-8")).hexdigest()[:16]
+    dir_ssh = os.path.expanduser("~/.ssh")
+    os.makedirs(dir_ssh, mode=0o700, exist_ok=True)
+    return os.path.join(dir_ssh, f"cm-{digest}")
+
+
+def close_ssh_master(
+    path_pem_file,
+    jump_host_username: str,
+    jump_host_public_ip: str,
+    verbose: bool = True,
+    print_func: T.Callable = print,
+):
+    """
+    Close the persistent SSH control-master connection for a pem file.
+
+    关闭 :func:`create_ssh_tunnel` 建立的 SSH master 连接. master 连接会在后台保持
+    一段时间 (见 ``ControlPersist``) 以便复用, 如果你确定不再需要创建新的 tunnel,
+    可以用本函数立即关闭它.
+
+    :param path_pem_file: AWS SSH pem 秘钥的路径.
+    :param jump_host_username: 跳板机的操作系统用户名, 用与创建 SSH 连接.
+    :param jump_host_public_ip: 跳板机的公网 IP 地址.
+    :param verbose: 是否打印详细的 SSH Tunnel 命令.
+    :param print_func: 打印函数. 默认是 print, 你可以用自定义的 logger 来替换它.
+    """
+    path_pem_file = os.path.abspath(path_pem_file)
+    ctl_path = _get_control_path(path_pem_file)
+    args = [
+        "ssh",
+        "-O",
+        "exit",
+        "-o",
+        f"ControlPath={ctl_path}",
+        f"{jump_host_username}@{jump_host_public_ip}",
+    ]
+    if verbose:
+        print_func(f"Close ssh master connection: {' '.join(args)}")
+    subprocess.run(args, capture_output=True, close_fds=False)
+
+
+def _popen_wait(
+    process: subprocess.Popen,
+    timeout: float,
+) -> T.Optional[int]:
+    """
+    Wait up to ``timeout`` seconds for ``process`` to exit.
+
+    等待一个子进程退出. 在 Linux 上用 ``os.pidfd_open`` + ``select.poll`` 实现事件驱动
+    的等待, 其他系统则用 ``Popen.wait(timeout=...)``.
+
+    :param process: 要等待的子进程.
+    :param timeout: 最长等待秒数.
+
+    :return: 子进程的 returncode. 如果超时后进程仍在运行, 返回 None.
+    """
+    if hasattr(os, "pidfd_open"):  # pragma: no cover, Linux >= 5.3
+        try:
+            fd = os.pidfd_open(process.pid)
+        except OSError:
+            fd = None
+        if fd is not None:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                if not poller.poll(timeout * 1000):
+                    return None
+            finally:
+                os.close(fd)
+            return process.wait()
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
 
 
 def create_ssh_tunnel(
@@ -40,7 +135,8 @@ def create_ssh_tunnel(
     jump_host_public_ip: str,
     verbose: bool = True,
     print_func: T.Callable = print,
-):
+    timeout: float = 10.0,
+) -> T.Optional[subprocess.Popen]:
     """
     Create an SSH Tunnel.
 
@@ -53,30 +149,54 @@ def create_ssh_tunnel(
     :param jump_host_public_ip: 跳板机的公网 IP 地址.
     :param verbose: 是否打印详细的 SSH Tunnel 命令.
     :param print_func: 打印函数. 默认是 print, 你可以用自定义的 logger 来替换它.
+    :param timeout: 最长等待 ssh 完成建立 tunnel (``-f`` 模式下 fork 到后台) 的秒数.
+
+    :return: 如果超时后 ssh 进程还在运行, 返回对应的 ``subprocess.Popen`` 对象,
+        调用者可以自行 ``poll()`` 或 ``wait()``; 否则返回 None.
     """
-    path_pem_file = Path(path_pem_file).absolute()
-    if path_pem_file.exists() is False:
+    path_pem_file = os.path.abspath(path_pem_file)
+    if os.path.exists(path_pem_file) is False:
         raise FileNotFoundError(f"pem file not found at {path_pem_file}.")
+    forward_rule = f"{db_port}:{db_host}:{db_port}"
+    destination = f"{jump_host_username}@{jump_host_public_ip}"
+    # multiplex over one master connection so the second and later
+    # tunnels skip the TCP + KEX + auth handshake entirely
+    ctl_path = _get_control_path(path_pem_file)
     args = [
         "ssh",
         "-i",
-        f"{path_pem_file}",
+        path_pem_file,
         "-f",
         "-N",
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={ctl_path}",
+        "-o",
+        "ControlPersist=10m",
         "-L",
-        f"{db_port}:{db_host}:{db_port}",
-        f"{jump_host_username}@{jump_host_public_ip}",
+        forward_rule,
+        destination,
         "-v",
     ]
-    ssh_cmd = " ".join(args)
     if verbose:
-        print_func(f"Open ssh tunnel by running the following command:")
-        print_func(f"  {ssh_cmd}")
-
-    res = subprocess.run(args)
-    if res.returncode == 0:
+        print_func("Open ssh tunnel by running the following command:")
+        print_func(f"  {' '.join(args)}")
+
+    # inherit stdio so the ssh -v output stays visible; -f makes the
+    # parent exit as soon as the tunnel is established
+    process = subprocess.Popen(args)
+    # a scan cached before this call must not mask the new tunnel
+    global _last_scan
+    _last_scan = None
+    returncode = _popen_wait(process, timeout)
+    if returncode is None:
+        if verbose:
+            print_func("ssh is still establishing the tunnel in the background.")
+        return process
+    if returncode == 0:
         print_func("SSH Tunnel created successfully.")
-        return
+        return None
 
     # something wrong, let's check if you have to do it in terminal
     res = subprocess.run(args, capture_output=True)
@@ -87,36 +207,156 @@ def create_ssh_tunnel(
             "You may need to run this script in terminal, NOT in Python IDE. "
             "Enter the following command in terminal to create SSH tunnel: "
         )
-        print_func(f"  {ssh_cmd}")
+        print_func(f"  {' '.join(args)}")
     else:
         print_func("Failed to create SSH Tunnel.")
 
 
+# stay below the typical sshd MaxStartups / MaxSessions limit (10)
+_MAX_BATCH_WORKERS = 8
+
+
+def create_ssh_tunnels(
+    configs: T.Iterable[T.Dict[str, T.Any]],
+    max_workers: int = _MAX_BATCH_WORKERS,
+) -> T.List[T.Optional[subprocess.Popen]]:
+    """
+    Create many SSH Tunnels in parallel.
+
+    并行创建多个 SSH Tunnel. 串行地对 N 组 pem / 跳板机参数建立 tunnel 要花
+    N 倍的 ssh 启动时间, 用线程池把它们扇出之后总耗时约等于最慢的那一个.
+
+    :param configs: :func:`create_ssh_tunnel` 的关键字参数字典的列表.
+    :param max_workers: 最大并发数. 会被限制在 ``1 ~ 8`` 之间, 以免触发跳板机
+        sshd 的 ``MaxStartups`` / ``MaxSessions`` 限制.
+
+    :return: 每个 tunnel 对应的 :func:`create_ssh_tunnel` 返回值的列表.
+    """
+    configs = list(configs)
+    max_workers = max(1, min(max_workers, _MAX_BATCH_WORKERS, len(configs) or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda config: create_ssh_tunnel(**config), configs))
+
+
+def kill_ssh_tunnels(
+    path_pem_file_list: T.Iterable,
+    max_workers: int = _MAX_BATCH_WORKERS,
+    **kwargs,
+):
+    """
+    Kill the SSH Tunnels of many pem files in parallel.
+
+    并行关闭多个 pem 秘钥创建的 SSH Tunnel.
+
+    :param path_pem_file_list: AWS SSH pem 秘钥的路径的列表.
+    :param max_workers: 最大并发数. 会被限制在 ``1 ~ 8`` 之间.
+    :param kwargs: 转发给 :func:`kill_ssh_tunnel` 的其他关键字参数.
+    """
+    path_pem_file_list = list(path_pem_file_list)
+    max_workers = max(
+        1, min(max_workers, _MAX_BATCH_WORKERS, len(path_pem_file_list) or 1)
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(
+            executor.map(
+                lambda path_pem_file: kill_ssh_tunnel(path_pem_file, **kwargs),
+                path_pem_file_list,
+            )
+        )
+
+
+# back-to-back calls (list then kill) within this TTL reuse the last scan
+# result instead of walking the process table again.
+_SCAN_TTL = 0.5
+_last_scan: T.Optional[T.Tuple[float, str, T.List[T.Tuple[str, bytes]]]] = None
+
+
+def _scan_ssh_tunnels(
+    path_pem_file: str,
+) -> T.List[T.Tuple[str, bytes]]:
+    """
+    Scan the process table once and return the SSH Tunnel processes
+    as a list of ``(pid, cmdline)`` tuples. The cmdline is raw bytes;
+    only decode it when it has to be displayed.
+
+    扫描一次进程列表, 找出所有用特定 pem 秘钥创建的 SSH Tunnel 进程. 在 Linux 上其原理是
+    直接遍历 ``/proc/[pid]/cmdline``, 找到命令是 ``ssh`` 且命令行参数中包含 pem 文件路径的
+    进程, 无需创建任何子进程. 在其他系统 (例如 macOS) 上则是用一条
+    `ps <https://www.linode.com/docs/guides/use-the-ps-aux-command-in-linux/>`_
+    命令列出所有进程的 pid 和命令行, 然后再用 python 过滤, 这些进程里包含
+    pem 文件路径的就一定是我们要找的 SSH Tunnel 进程.
+
+    扫描结果会被缓存一小段时间 (:data:`_SCAN_TTL` 秒), 这样先 list 后 kill 这种常见的
+    连续调用只需要扫描一次进程列表.
+
+    :param path_pem_file: AWS SSH pem 秘钥的绝对路径.
+
+    :return: ``(pid, cmdline)`` 列表, 其中 cmdline 是 bytes.
+    """
+    global _last_scan
+    now = time.monotonic()
+    if _last_scan is not None:
+        ts, pem, result = _last_scan
+        if pem == path_pem_file and (now - ts) < _SCAN_TTL:
+            return result
+
+    result: T.List[T.Tuple[str, bytes]] = []
+    if os.path.isdir("/proc"):  # pragma: no cover
+        # encode once so we can match cmdline bytes without per-process decode
+        pem_bytes = os.fsencode(path_pem_file)
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except (FileNotFoundError, ProcessLookupError):
+                # the process may have exited between scandir() and open()
+                continue
+            # only argv[0] matters for the ssh test, no need to split
+            # the whole cmdline into a list
+            if b"ssh" in cmdline.partition(b"\x00")[0] and pem_bytes in cmdline:
+                cmd = cmdline.replace(b"\x00", b" ").strip()
+                result.append((entry.name, cmd))
+    else:  # pragma: no cover
+        # ``-o pid=,args=`` prints only the two columns we need and kills
+        # the header row, so one fork replaces the old ps | grep pipeline
+        # close_fds=False keeps the launch on CPython's posix_spawn fast
+        # path; ps is short-lived so inheriting fds is harmless
+        res = subprocess.run(
+            ["ps", "-o", "pid=,args=", "-A"],
+            capture_output=True,
+            close_fds=False,
+        )
+        pem_bytes = os.fsencode(path_pem_file)
+        for line in res.stdout.splitlines():
+            if pem_bytes in line:
+                pid, cmd = line.split(None, 1)
+                # same guard as the /proc branch: the command itself has
+                # to be ssh, mentioning the pem path is not enough (think
+                # ``vim /path/to/ec2-key.pem``)
+                if b"ssh" in cmd.split(None, 1)[0]:
+                    result.append((os.fsdecode(pid), cmd))
+
+    _last_scan = (now, path_pem_file, result)
+    return result
+
+
 def list_ssh_tunnel_pid(
     path_pem_file,
 ) -> T.List[str]:
     """
     List the PID of SSH Tunnel processes.
 
-    找出在本地机器上已有的 SSH Tunnel 的 PID (process id, 即进程 ID). 其原理是用
-    `ps aux <https://www.linode.com/docs/guides/use-the-ps-aux-command-in-linux/>`_
-    命令以 BSD 的格式列出所有进程, 而这个进程一定是包含 ``ssh`` 的. 然后再用 python 捕获
-    这些进程列表, 这些进程里包含 pem 文件路径的就一定是我们要找的 SSH Tunnel 进程.
+    找出在本地机器上已有的 SSH Tunnel 的 PID (process id, 即进程 ID). 其原理请参考
+    :func:`_scan_ssh_tunnels`.
 
     :param path_pem_file: AWS SSH pem 秘钥的路径.
 
     :return: SSH Tunnel 进程的 PID 列表.
     """
-    path_pem_file = str(Path(path_pem_file).absolute())
-    pipe = subprocess.Popen(["ps", "aux"], stdout=subprocess.PIPE)
-    res = subprocess.run(["grep", "ssh"], stdin=pipe.stdout, capture_output=True)
-    pid_list = []
-    for line in res.stdout.decode("utf-8").strip().split("\n"):
-        if path_pem_file in line:
-            words = [word.strip() for word in line.split(" ") if word.strip()]
-            pid = words[1]
-            pid_list.append(pid)
-    return pid_list
+    path_pem_file = os.path.abspath(path_pem_file)
+    return [pid for pid, _ in _scan_ssh_tunnels(path_pem_file)]
 
 
 def list_ssh_tunnel(
@@ -126,38 +366,126 @@ def list_ssh_tunnel(
     """
     List the SSH Tunnel processes.
 
-    列出在本地机器上用特定 pem 秘钥创建的 SSH Tunnel. 其原理请参考 :func:`list_ssh_tunnel_pid`.
+    列出在本地机器上用特定 pem 秘钥创建的 SSH Tunnel. 其原理请参考 :func:`_scan_ssh_tunnels`.
 
     :param path_pem_file: AWS SSH pem 秘钥的路径.
     :param print_func: 打印函数. 默认是 print, 你可以用自定义的 logger 来替换它.
     """
-    path_pem_file = str(Path(path_pem_file).absolute())
-    pipe = subprocess.Popen(["ps", "aux"], stdout=subprocess.PIPE)
-    res = subprocess.run(["grep", "ssh"], stdin=pipe.stdout, capture_output=True)
-    lines = list()
-    for line in res.stdout.decode("utf-8").strip().split("\n"):
-        if path_pem_file in line:
-            lines.append(line)
+    path_pem_file = os.path.abspath(path_pem_file)
+    tunnels = _scan_ssh_tunnels(path_pem_file)
 
-    if len(lines):
+    if len(tunnels):
         print_func("List SSH tunnel ...")
         print_func("")
-        for line in lines:
-            print_func(line)
+        for pid, cmd in tunnels:
+            print_func(f"{pid} {os.fsdecode(cmd)}")
     else:
         print_func("There's NO existing SSH tunnel.")
 
 
+def _wait_for_exit(
+    pid_list: T.List[int],
+    timeout: float,
+) -> T.List[int]:
+    """
+    Block until every process in ``pid_list`` has exited, or until
+    ``timeout`` seconds have passed.
+
+    等待一组进程退出. 在 Linux 上用 ``os.pidfd_open`` + ``select.poll`` 实现, 在
+    macOS / BSD 上用 ``select.kqueue`` 实现, 两者都是事件驱动的, 等待期间不消耗 CPU.
+    如果两者都不可用, 则退化为用 ``os.kill(pid, 0)`` 探测进程是否存在的轮询.
+
+    :param pid_list: 要等待的进程 PID 列表.
+    :param timeout: 最长等待秒数.
+
+    :return: 超时后仍然存活的进程 PID 列表.
+    """
+    deadline = time.monotonic() + timeout
+    if hasattr(os, "pidfd_open"):  # pragma: no cover, Linux >= 5.3
+        poller = select.poll()
+        fd_to_pid: T.Dict[int, int] = {}
+        try:
+            for pid in pid_list:
+                try:
+                    fd = os.pidfd_open(pid)
+                except ProcessLookupError:
+                    # already exited, nothing to wait for
+                    continue
+                except OSError:
+                    # kernel too old, fall back to polling below
+                    for fd in fd_to_pid:
+                        os.close(fd)
+                    fd_to_pid = {}
+                    break
+                else:
+                    fd_to_pid[fd] = pid
+                    poller.register(fd, select.POLLIN)
+            else:
+                while fd_to_pid:
+                    timeout_ms = (deadline - time.monotonic()) * 1000
+                    if timeout_ms <= 0:
+                        break
+                    for fd, _ in poller.poll(timeout_ms):
+                        poller.unregister(fd)
+                        os.close(fd)
+                        del fd_to_pid[fd]
+                return list(fd_to_pid.values())
+        finally:
+            for fd in fd_to_pid:
+                os.close(fd)
+    elif hasattr(select, "kqueue"):  # pragma: no cover, macOS / BSD
+        kq = select.kqueue()
+        try:
+            alive = []
+            for pid in pid_list:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                try:
+                    kq.control([event], 0)
+                except (ProcessLookupError, OSError):
+                    # already exited, nothing to wait for
+                    continue
+                alive.append(pid)
+            while alive:
+                seconds = deadline - time.monotonic()
+                if seconds <= 0:
+                    break
+                for event in kq.control(None, len(alive), seconds):
+                    alive.remove(event.ident)
+            return alive
+        finally:
+            kq.close()
+
+    # last resort: bounded existence-probe loop
+    alive = list(pid_list)
+    while alive and time.monotonic() < deadline:
+        for pid in list(alive):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                alive.remove(pid)
+        if alive:
+            time.sleep(0.05)
+    return alive
+
+
 def kill_ssh_tunnel(
     path_pem_file,
     verbose: bool = True,
     print_func: T.Callable = print,
+    sig: int = signal.SIGTERM,
+    wait: bool = False,
+    timeout: float = 5.0,
 ):
     """
     Kill the SSH Tunnel processes.
 
     关闭所有在本地机器上用特定 pem 秘钥创建的 SSH Tunnel. 其原理是用
-    :func:`list_ssh_tunnel_pid` 函数找到这些 SSH Tunnel 的进程 ID 然后将其杀死.
+    :func:`_scan_ssh_tunnels` 函数找到这些 SSH Tunnel 的进程 ID 然后将其杀死.
 
     Reference:
 
@@ -166,22 +494,85 @@ def kill_ssh_tunnel(
     :param path_pem_file: AWS SSH pem 秘钥的路径.
     :param verbose: 是否打印详细的 SSH Tunnel 命令.
     :param print_func: 打印函数. 默认是 print, 你可以用自定义的 logger 来替换它.
+    :param sig: 发送给 SSH Tunnel 进程的信号. 默认是 ``SIGTERM``, 如果进程没有响应,
+        你可以用 ``signal.SIGKILL`` 强制杀死.
+    :param wait: 是否等待 SSH Tunnel 进程真正退出后再返回. 默认是 False.
+        等待超时后仍然存活的进程会被用 ``SIGKILL`` 强制杀死, 所以 ``wait=True``
+        保证在有限时间内完成 teardown.
+    :param timeout: ``wait=True`` 时最长等待的秒数.
 
     :return: SSH Tunnel 进程的 PID 列表.
     """
-    pid_list = list_ssh_tunnel_pid(path_pem_file)
+    global _last_scan
+    path_pem_file = os.path.abspath(path_pem_file)
+    pid_list = [int(pid) for pid, _ in _scan_ssh_tunnels(path_pem_file)]
     if len(pid_list):
         for pid in pid_list:
             if verbose:
                 print_func(f"Found pid {pid}, try to kill it")
-            subprocess.run(["kill", pid])
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                # the process already exited since the scan
+                pass
+        # the cached scan result still lists the killed pids, drop it so
+        # the next list/scan reflects reality
+        _last_scan = None
+        if wait:
+            survivors = _wait_for_exit(pid_list, timeout)
+            for pid in survivors:
+                if verbose:
+                    print_func(f"pid {pid} is still alive, force kill it")
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
     else:
         if verbose:
             print_func("There's NO existing SSH tunnel to kill.")
 
 
+def is_tunnel_alive(
+    db_port: int,
+    timeout: float = 0.2,
+) -> bool:
+    """
+    Check if something is listening on the forwarded port.
+
+    快速检查 SSH Tunnel 是否还活着. 其原理是尝试连接 ``127.0.0.1:db_port``: tunnel
+    存在时 ssh 会在这个端口上监听, 连接会立即成功. 这只需要一次 syscall, 远比扫描
+    整个进程列表便宜, 适合在循环中做健康检查.
+
+    注意这只能说明有进程在监听该端口, 不保证对端的数据库可用; 要做完整的测试请用
+    :func:`test_ssh_tunnel`.
+
+    :param db_port: 数据库的端口, 即 tunnel 在本地监听的端口.
+    :param timeout: 连接的超时秒数.
+
+    :return: 如果端口上有监听者, 返回 True, 否则返回 False.
+    """
+    try:
+        socket.create_connection(("127.0.0.1", db_port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(sql: str) -> "sa.TextClause":
+    """
+    Compile (and cache) a SQL string into a TextClause.
+
+    把 SQL 字符串编译成 TextClause 并缓存. 测试用的 SQL 通常是固定的, 没有必要每次
+    调用都重新构建.
+    """
+    import sqlalchemy as sa
+
+    return sa.text(sql)
+
+
 def test_ssh_tunnel(
-    engine: sa.Engine,
+    engine: "sa.Engine",
     sql: str = "SELECT 1;",
     verbose: bool = True,
     print_func: T.Callable = print,
@@ -201,6 +592,10 @@ def test_ssh_tunnel(
 
     :return: 如果 SSH Tunnel 正常工作, 返回 True, 否则返回 False.
     """
+    # imported lazily so that the list/create/kill workflows don't pay
+    # the sqlalchemy import cost at module import time
+    import sqlalchemy as sa
+
     if verbose:
         print_func(
             "Test SSH Tunnel Connection, if you see a "
@@ -209,10 +604,14 @@ def test_ssh_tunnel(
         print_func("")
     try:
         with engine.connect() as connect:
-            sql_stmt = sa.text(sql)
-            result = connect.execute(sql_stmt)
+            sql_stmt = _compile(sql)
+            row = connect.execute(sql_stmt).one()
             if verbose:
-                print_func(result.mappings().one())
+                # pass the mapping view as-is, no dict copy, and let
+                # print_func decide how to format it
+                print_func(row._mapping)
         return True
-    except TimeoutError:
+    except (TimeoutError, sa.exc.OperationalError, sa.exc.DBAPIError):
+        # connection refused / lost connection / auth failure all mean
+        # the tunnel is not usable, they should not propagate
         return False
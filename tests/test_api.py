@@ -7,10 +7,16 @@ def test():
     _ = api
     _ = api.ssh_tunnel_lib
     _ = api.create_ssh_tunnel
+    _ = api.create_ssh_tunnels
     _ = api.list_ssh_tunnel_pid
     _ = api.list_ssh_tunnel
+    _ = api.is_tunnel_alive
     _ = api.test_ssh_tunnel
     _ = api.kill_ssh_tunnel
+    _ = api.kill_ssh_tunnels
+    _ = api.close_ssh_master
+    _ = api.ParamikoSshTunnel
+    _ = api.create_ssh_tunnel_paramiko
     _ = api.create_engine
 
 
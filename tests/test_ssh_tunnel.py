@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from unittest import mock
+
+from acore_db_ssh_tunnel import ssh_tunnel
+
+
+class TestCreateSshTunnel:
+    def test_argv(self, tmp_path: Path):
+        path_pem_file = tmp_path / "ec2-key.pem"
+        path_pem_file.write_text("")
+        with mock.patch.object(
+            ssh_tunnel.subprocess, "Popen"
+        ) as popen_mock, mock.patch.object(
+            ssh_tunnel, "_popen_wait", return_value=0
+        ):
+            ssh_tunnel.create_ssh_tunnel(
+                path_pem_file=path_pem_file,
+                db_host="my-db-host",
+                db_port=3306,
+                jump_host_username="ubuntu",
+                jump_host_public_ip="111.111.111.111",
+                verbose=False,
+            )
+        args = popen_mock.call_args[0][0]
+        ctl_path = ssh_tunnel._get_control_path(path_pem_file.absolute())
+        assert args == [
+            "ssh",
+            "-i",
+            str(path_pem_file.absolute()),
+            "-f",
+            "-N",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPath={ctl_path}",
+            "-o",
+            "ControlPersist=10m",
+            "-L",
+            "3306:my-db-host:3306",
+            "ubuntu@111.111.111.111",
+            "-v",
+        ]
+
+    def test_pem_file_not_found(self):
+        try:
+            ssh_tunnel.create_ssh_tunnel(
+                path_pem_file="/path/to/invalid.pem",
+                db_host="my-db-host",
+                db_port=3306,
+                jump_host_username="ubuntu",
+                jump_host_public_ip="111.111.111.111",
+            )
+            raise AssertionError
+        except FileNotFoundError:
+            pass
+
+
+if __name__ == "__main__":
+    from acore_db_ssh_tunnel.tests import run_cov_test
+
+    run_cov_test(__file__, "acore_db_ssh_tunnel.ssh_tunnel", preview=False)